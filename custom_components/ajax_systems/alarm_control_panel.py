@@ -20,6 +20,8 @@ from .coordinator import AjaxDataUpdateCoordinator, AjaxGroup
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
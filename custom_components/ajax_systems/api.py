@@ -10,6 +10,8 @@ from typing import Any
 import aiohttp
 from aiohttp import ClientError, ClientResponseError
 
+from homeassistant.util.json import json_loads
+
 from .const import (
     API_BASE_URL,
     API_TIMEOUT,
@@ -32,6 +34,17 @@ class AjaxConnectionError(AjaxApiError):
     """Connection error."""
 
 
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response straight from the raw body bytes."""
+    body = await response.read()
+    if not body.strip():
+        return None
+    try:
+        return json_loads(body)
+    except ValueError as err:
+        raise AjaxApiError(f"Invalid JSON response: {err}") from err
+
+
 class AjaxApi:
     """API client for Ajax Systems.
 
@@ -66,10 +79,27 @@ class AjaxApi:
         self._refresh_token: str | None = None
         self._user_id: str | None = None
         self._token_expiry: datetime | None = None
+        # Serializes token renewal across concurrent requests
+        self._auth_lock = asyncio.Lock()
 
         # Determine auth mode
         self._is_company_auth = bool(company_id and company_token)
 
+        # Request headers, built once; only the session token ever changes
+        self._base_headers = {
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        self._company_headers = (
+            {**self._base_headers, "X-Company-Token": company_token}
+            if self._is_company_auth
+            else self._base_headers
+        )
+        self._session_headers: tuple[str | None, dict[str, str]] = (
+            None,
+            self._base_headers,
+        )
+
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash password using SHA-256."""
@@ -130,7 +160,13 @@ class AjaxApi:
         if self._is_company_auth:
             return  # Company tokens are always valid
 
-        if self._is_token_expired():
+        if not self._is_token_expired():
+            return
+
+        async with self._auth_lock:
+            # A concurrent request may have renewed the token while we waited
+            if not self._is_token_expired():
+                return
             if self._refresh_token and self._user_id:
                 await self._refresh_session()
             elif self._username and self._password_hash:
@@ -139,18 +175,22 @@ class AjaxApi:
                 raise AjaxAuthError("No valid authentication method available")
 
     def _get_auth_headers(self) -> dict[str, str]:
-        """Get authentication headers based on auth mode."""
-        headers = {
-            "X-Api-Key": self._api_key,
-            "Content-Type": "application/json",
-        }
+        """Get authentication headers based on auth mode.
 
+        The returned dict is shared between requests and must not be mutated.
+        """
         if self._is_company_auth:
-            headers["X-Company-Token"] = self._company_token
-        elif self._session_token:
-            headers["X-Session-Token"] = self._session_token
-
-        return headers
+            return self._company_headers
+
+        token = self._session_token
+        if not token:
+            return self._base_headers
+        if self._session_headers[0] != token:
+            self._session_headers = (
+                token,
+                {**self._base_headers, "X-Session-Token": token},
+            )
+        return self._session_headers[1]
 
     def _get_base_path(self) -> str:
         """Get base path for API calls based on auth mode."""
@@ -169,9 +209,11 @@ class AjaxApi:
         if auth_required and not self._is_company_auth:
             await self._ensure_valid_token()
 
+        session_token = self._session_token
         url = f"{API_BASE_URL}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        headers.update(self._get_auth_headers() if auth_required else {"X-Api-Key": self._api_key, "Content-Type": "application/json"})
+        headers = self._get_auth_headers() if auth_required else self._base_headers
+        if extra_headers := kwargs.pop("headers", None):
+            headers = {**extra_headers, **headers}
 
         try:
             async with self._session.request(
@@ -185,15 +227,23 @@ class AjaxApi:
                     return None
                 if response.status == 202:
                     # Async operation in progress
-                    return await response.json()
+                    return await _read_json(response)
 
                 response.raise_for_status()
-                return await response.json()
+                return await _read_json(response)
 
         except ClientResponseError as err:
             if err.status == 401:
-                if not self._is_company_auth and self._refresh_token and self._user_id:
-                    await self._refresh_session()
+                if (
+                    auth_required
+                    and not self._is_company_auth
+                    and self._refresh_token
+                    and self._user_id
+                ):
+                    async with self._auth_lock:
+                        # Skip if a concurrent request already refreshed it
+                        if self._session_token == session_token:
+                            await self._refresh_session()
                     return await self._request(method, endpoint, auth_required, **kwargs)
                 raise AjaxAuthError("Authentication failed") from err
             if err.status == 403:
@@ -9,16 +9,17 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import AjaxDataUpdateCoordinator, AjaxDevice
+from .entity import AjaxDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,13 +61,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AjaxBinarySensorBase(
-    CoordinatorEntity[AjaxDataUpdateCoordinator], BinarySensorEntity
-):
+class AjaxBinarySensorBase(AjaxDeviceEntity, BinarySensorEntity):
     """Base class for Ajax binary sensors."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: AjaxDataUpdateCoordinator,
@@ -74,35 +71,9 @@ class AjaxBinarySensorBase(
         sensor_type: str,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._device_id = device.id
+        super().__init__(coordinator, device, sensor_type)
         self._sensor_type = sensor_type
 
-        self._attr_unique_id = f"{DOMAIN}_{device.id}_{sensor_type}"
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.id)},
-            name=device.display_name,
-            manufacturer="Ajax Systems",
-            model=device.device_type,
-            via_device=(DOMAIN, coordinator.hub_id),
-        )
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get device data from coordinator."""
-        return self.coordinator.data.devices.get(self._device_id)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        device = self._get_device()
-        return device is not None and device.online
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
 class AjaxMotionSensor(AjaxBinarySensorBase):
     """Representation of an Ajax motion sensor."""
@@ -23,9 +23,11 @@ from .const import (
     CONF_AWS_SECRET_KEY,
     CONF_COMPANY_ID,
     CONF_COMPANY_TOKEN,
+    CONF_DISARMED_SCAN_INTERVAL,
     CONF_HUB_ID,
     CONF_PASSWORD_HASH,
     CONF_REFRESH_TOKEN,
+    CONF_SCAN_INTERVAL,
     CONF_SESSION_TOKEN,
     CONF_SPACE_ID,
     CONF_SQS_ENABLED,
@@ -417,7 +419,10 @@ class AjaxSystemsOptionsFlow(OptionsFlow):
             return self.async_create_entry(title="", data=new_options)
 
         current_interval = self.config_entry.options.get(
-            "scan_interval", DEFAULT_SCAN_INTERVAL
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+        current_disarmed_interval = self.config_entry.options.get(
+            CONF_DISARMED_SCAN_INTERVAL, current_interval
         )
 
         return self.async_show_form(
@@ -425,9 +430,13 @@ class AjaxSystemsOptionsFlow(OptionsFlow):
             data_schema=vol.Schema(
                 {
                     vol.Optional(
-                        "scan_interval",
+                        CONF_SCAN_INTERVAL,
                         default=current_interval,
                     ): vol.All(vol.Coerce(int), vol.Range(min=3, max=300)),
+                    vol.Optional(
+                        CONF_DISARMED_SCAN_INTERVAL,
+                        default=current_disarmed_interval,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=3, max=300)),
                 }
             ),
         )
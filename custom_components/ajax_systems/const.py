@@ -1,4 +1,5 @@
 """Constants for Ajax Systems integration."""
+from enum import StrEnum
 
 DOMAIN = "ajax_systems"
 
@@ -29,6 +30,8 @@ AUTH_MODE_USER = "user"
 # Configuration
 CONF_HUB_ID = "hub_id"
 CONF_SPACE_ID = "space_id"
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_DISARMED_SCAN_INTERVAL = "disarmed_scan_interval"
 
 # AWS SQS Configuration (Enterprise API)
 CONF_SQS_ENABLED = "sqs_enabled"
@@ -43,6 +46,18 @@ DEFAULT_SCAN_INTERVAL = 3
 MIN_SCAN_INTERVAL = 3
 MAX_SCAN_INTERVAL = 300
 
+# Resync polling interval while SQS pushes real-time events (seconds)
+SQS_FALLBACK_SCAN_INTERVAL = 300
+# Shorter resync interval used right after SQS events were received (seconds)
+SQS_ACTIVE_SCAN_INTERVAL = 30
+# How long the hub counts as active after the last SQS event (seconds)
+SQS_ACTIVITY_WINDOW = 300
+# Delay used to coalesce bursts of SQS state updates (seconds)
+SQS_UPDATE_COOLDOWN = 0.05
+
+# Minimum time between repeated update error logs (seconds)
+ERROR_LOG_INTERVAL = 60
+
 # Session token TTL (15 minutes, refresh at 10 minutes)
 SESSION_TOKEN_TTL = 15 * 60
 SESSION_TOKEN_REFRESH_MARGIN = 5 * 60
@@ -64,7 +79,7 @@ SIGNAL_LEVEL_MAP = {
 }
 
 # Device type categories for entity creation
-MOTION_SENSORS = [
+MOTION_SENSORS = (
     "MotionProtect",
     "MotionProtectS",
     "MotionProtectFibra",
@@ -78,9 +93,9 @@ MOTION_SENSORS = [
     "CombiProtect",
     "CombiProtectS",
     "CombiProtectFibra",
-]
+)
 
-DOOR_SENSORS = [
+DOOR_SENSORS = (
     "DoorProtect",
     "DoorProtectS",
     "DoorProtectU",
@@ -88,50 +103,61 @@ DOOR_SENSORS = [
     "DoorProtectPlus",
     "DoorProtectSPlus",
     "DoorProtectPlusFibra",
-]
+)
 
-SMOKE_SENSORS = [
+SMOKE_SENSORS = (
     "FireProtect",
     "FireProtectPlus",
     "FireProtect2",
     "FireProtect2Plus",
-]
+)
 
-WATER_SENSORS = [
+WATER_SENSORS = (
     "LeaksProtect",
     "WaterStop",
-]
+)
 
-GLASS_BREAK_SENSORS = [
+GLASS_BREAK_SENSORS = (
     "GlassProtect",
     "GlassProtectS",
     "GlassProtectFibra",
-]
+)
 
-SWITCHES = [
+SWITCHES = (
     "Socket",
     "WallSwitch",
     "Relay",
     "LightSwitch",
-]
+)
 
-SIRENS = [
+SIRENS = (
     "HomeSiren",
     "HomeSirenS",
     "HomeSirenFibra",
     "StreetSiren",
     "StreetSirenPlus",
     "StreetSirenFibra",
-]
+)
 
-KEYPADS = [
+KEYPADS = (
     "Keypad",
     "KeypadPlus",
     "KeypadCombi",
     "KeypadTouchscreen",
-]
+)
 
-RANGE_EXTENDERS = [
+RANGE_EXTENDERS = (
     "RangeExtender",
     "RangeExtender2",
-]
+)
+
+
+class DeviceCategory(StrEnum):
+    """Device category used for entity creation and state parsing."""
+
+    DOOR = "door"
+    MOTION = "motion"
+    SMOKE = "smoke"
+    WATER = "water"
+    GLASS_BREAK = "glass_break"
+    SWITCH = "switch"
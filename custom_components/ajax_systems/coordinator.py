@@ -1,13 +1,17 @@
 """Data update coordinator for Ajax Systems."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
+from functools import lru_cache
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import AjaxApi, AjaxApiError, AjaxAuthError
@@ -15,27 +19,140 @@ from .const import (
     CONF_AWS_ACCESS_KEY,
     CONF_AWS_REGION,
     CONF_AWS_SECRET_KEY,
+    CONF_DISARMED_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
     CONF_SQS_ENABLED,
     CONF_SQS_QUEUE_URL,
     DEFAULT_AWS_REGION,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     DOOR_SENSORS,
+    ERROR_LOG_INTERVAL,
     GLASS_BREAK_SENSORS,
     MOTION_SENSORS,
     SIGNAL_LEVEL_MAP,
     SMOKE_SENSORS,
+    SQS_ACTIVE_SCAN_INTERVAL,
+    SQS_ACTIVITY_WINDOW,
+    SQS_FALLBACK_SCAN_INTERVAL,
+    SQS_UPDATE_COOLDOWN,
     SWITCHES,
     WATER_SENSORS,
+    DeviceCategory,
+)
+from .sqs_listener import (
+    EVENT_TYPE_ARM,
+    EVENT_TYPE_DEVICE_STATE,
+    EVENT_TYPE_DEVICE_TRIGGERED,
+    EVENT_TYPE_DISARM,
+    EVENT_TYPE_NIGHT_MODE,
+    AjaxSqsEvent,
+    AjaxSqsListener,
 )
-
-if TYPE_CHECKING:
-    from .sqs_listener import AjaxSqsEvent, AjaxSqsListener
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing nested payload objects (never mutated)
+_EMPTY: dict[str, Any] = {}
 
-@dataclass
+# Marker for keys missing from a payload (distinct from an explicit None)
+_MISSING: Any = object()
+
+# Device type tokens per category, in order of precedence
+_CATEGORY_TYPES: tuple[tuple[DeviceCategory, tuple[str, ...]], ...] = (
+    (DeviceCategory.DOOR, DOOR_SENSORS),
+    (DeviceCategory.MOTION, MOTION_SENSORS),
+    (DeviceCategory.SMOKE, SMOKE_SENSORS),
+    (DeviceCategory.WATER, WATER_SENSORS),
+    (DeviceCategory.GLASS_BREAK, GLASS_BREAK_SENSORS),
+    (DeviceCategory.SWITCH, SWITCHES),
+)
+
+
+def _door_triggered(model: dict[str, Any]) -> bool:
+    """Return True if a door/window sensor reports open."""
+    return not model.get("reedClosed", True)
+
+
+def _state_triggered(states: frozenset[str]) -> Callable[[dict[str, Any]], bool]:
+    """Build a check for model states that count as triggered."""
+
+    def triggered(model: dict[str, Any]) -> bool:
+        return model.get("state", "").upper() in states
+
+    return triggered
+
+
+# Triggered-state extractor per device category
+_TRIGGER_HANDLERS: dict[DeviceCategory, Callable[[dict[str, Any]], bool]] = {
+    DeviceCategory.DOOR: _door_triggered,
+    DeviceCategory.MOTION: _state_triggered(frozenset({"ACTIVE", "ALARM", "TRIGGERED"})),
+    DeviceCategory.SMOKE: _state_triggered(frozenset({"ALARM", "TRIGGERED", "SMOKE"})),
+    DeviceCategory.WATER: _state_triggered(frozenset({"ALARM", "TRIGGERED", "LEAK"})),
+    DeviceCategory.GLASS_BREAK: _state_triggered(frozenset({"ALARM", "TRIGGERED"})),
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_arm_state(state: str) -> tuple[bool, bool]:
+    """Return (armed, night_mode) flags for an arm state string."""
+    state = state.upper()
+    armed = "ARMED" in state and "DISARMED" not in state
+    night_mode = "NIGHT_MODE" in state and "OFF" not in state
+    return armed, night_mode
+
+
+def _get_fallback(
+    primary: dict[str, Any],
+    key: str,
+    secondary: dict[str, Any],
+    secondary_key: str,
+    default: Any = None,
+) -> Any:
+    """Return primary[key] if present, else secondary[secondary_key] or default.
+
+    Same result as primary.get(key, secondary.get(secondary_key, default)),
+    without doing the fallback lookup when the primary key is present.
+    """
+    value = primary.get(key, _MISSING)
+    if value is _MISSING:
+        return secondary.get(secondary_key, default)
+    return value
+
+
+def _parse_switch_state(value: Any) -> bool | None:
+    """Return the on/off state of a switch payload, or None if unknown.
+
+    Accepts a bool, an "ON"/"OFF" string or a nested {"state": "ON"} dict.
+    """
+    if isinstance(value, dict):
+        value = value.get("state")
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.upper() == "ON"
+    return None
+
+
+def _device_id(data: dict[str, Any]) -> str:
+    """Return the device id from a device payload."""
+    device_id = data.get("id", _MISSING)
+    if device_id is _MISSING:
+        return (data.get("model") or _EMPTY).get("id", "")
+    return device_id
+
+
+@lru_cache(maxsize=64)
+def classify_device_type(device_type: str) -> DeviceCategory | None:
+    """Return the category of a device type, matching known type names."""
+    # Substring match so variants (e.g. new hardware revisions) are covered
+    for category, types in _CATEGORY_TYPES:
+        if any(t in device_type for t in types):
+            return category
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class AjaxHub:
     """Representation of an Ajax Hub."""
 
@@ -51,10 +168,9 @@ class AjaxHub:
     gsm_signal: str | None = None
     wifi_signal: str | None = None
     groups_enabled: bool = False
-    raw_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AjaxDevice:
     """Representation of an Ajax device."""
 
@@ -72,7 +188,12 @@ class AjaxDevice:
     triggered: bool
     bypassed: bool
     firmware_version: str | None = None
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    switch_state: bool | None = None
+    category: DeviceCategory | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Classify the device once from its type."""
+        object.__setattr__(self, "category", classify_device_type(self.device_type))
 
     @property
     def display_name(self) -> str:
@@ -84,35 +205,35 @@ class AjaxDevice:
     @property
     def is_motion_sensor(self) -> bool:
         """Check if device is a motion sensor."""
-        return any(t in self.device_type for t in MOTION_SENSORS)
+        return self.category is DeviceCategory.MOTION
 
     @property
     def is_door_sensor(self) -> bool:
         """Check if device is a door/window sensor."""
-        return any(t in self.device_type for t in DOOR_SENSORS)
+        return self.category is DeviceCategory.DOOR
 
     @property
     def is_smoke_sensor(self) -> bool:
         """Check if device is a smoke sensor."""
-        return any(t in self.device_type for t in SMOKE_SENSORS)
+        return self.category is DeviceCategory.SMOKE
 
     @property
     def is_water_sensor(self) -> bool:
         """Check if device is a water leak sensor."""
-        return any(t in self.device_type for t in WATER_SENSORS)
+        return self.category is DeviceCategory.WATER
 
     @property
     def is_glass_break_sensor(self) -> bool:
         """Check if device is a glass break sensor."""
-        return any(t in self.device_type for t in GLASS_BREAK_SENSORS)
+        return self.category is DeviceCategory.GLASS_BREAK
 
     @property
     def is_switch(self) -> bool:
         """Check if device is a switch/relay."""
-        return any(t in self.device_type for t in SWITCHES)
+        return self.category is DeviceCategory.SWITCH
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AjaxGroup:
     """Representation of an Ajax group."""
 
@@ -120,16 +241,14 @@ class AjaxGroup:
     name: str
     armed: bool
     night_mode: bool
-    raw_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AjaxRoom:
     """Representation of an Ajax room."""
 
     id: str
     name: str
-    raw_data: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -158,60 +277,127 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
         self.api = api
         self.hub_id = hub_id
         self._last_hub_data: dict[str, Any] = {}
+        self._last_rooms_data: list[dict[str, Any]] | None = None
+        self._last_devices_data: list[dict[str, Any]] | None = None
+        # Last polled payload and parsed record per device id
+        self._parsed_devices: dict[str, tuple[dict[str, Any], AjaxDevice]] = {}
         self._sqs_listener: AjaxSqsListener | None = None
-
-        scan_interval = entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-
-        # Check if SQS is enabled (stored in options)
-        sqs_enabled = entry.options.get(CONF_SQS_ENABLED, False)
-        if sqs_enabled:
-            # When SQS is enabled, use longer polling interval as fallback
-            scan_interval = max(scan_interval, 30)
-            _LOGGER.info("SQS enabled, using %s seconds polling as fallback", scan_interval)
+        self._sqs_started = False
+        self._switch_locks: dict[str, asyncio.Lock] = {}
+        self._last_error_log = -ERROR_LOG_INTERVAL
+        self._last_sqs_event = -SQS_ACTIVITY_WINDOW
+        self._sqs_handlers: dict[str, Callable[[AjaxSqsEvent], bool]] = {
+            EVENT_TYPE_ARM: self._handle_sqs_arm_event,
+            EVENT_TYPE_DISARM: self._handle_sqs_arm_event,
+            EVENT_TYPE_NIGHT_MODE: self._handle_sqs_arm_event,
+            EVENT_TYPE_DEVICE_STATE: self._handle_sqs_device_event,
+            EVENT_TYPE_DEVICE_TRIGGERED: self._handle_sqs_device_event,
+        }
+
+        scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._scan_interval = timedelta(seconds=scan_interval)
+        # Never poll faster while disarmed, even if scan_interval was raised
+        # after the disarmed value was saved
+        self._disarmed_scan_interval = timedelta(
+            seconds=max(
+                entry.options.get(CONF_DISARMED_SCAN_INTERVAL, scan_interval),
+                scan_interval,
+            )
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=self._scan_interval,
+            # Only notify entities when the polled data actually changed
+            always_update=False,
         )
 
-        # Initialize SQS listener if enabled
-        if sqs_enabled:
+        # Coalesces listener updates from bursts of SQS events
+        self._sqs_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SQS_UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_notify_sqs_update,
+        )
+
+        # Initialize SQS listener if enabled (stored in options)
+        if entry.options.get(CONF_SQS_ENABLED, False):
             self._init_sqs_listener(entry)
 
+        if self._sqs_listener:
+            _LOGGER.info(
+                "SQS enabled, using %s seconds polling as fallback",
+                SQS_FALLBACK_SCAN_INTERVAL,
+            )
+
     async def _async_update_data(self) -> AjaxData:
         """Fetch data from API."""
         try:
-            # Get hub data
-            hub_data = await self.api.get_hub(self.hub_id)
+            # Hub, rooms and devices are independent, fetch them concurrently
+            tasks = (
+                asyncio.create_task(self.api.get_hub(self.hub_id)),
+                asyncio.create_task(self.api.get_hub_rooms(self.hub_id)),
+                asyncio.create_task(
+                    self.api.get_hub_devices(self.hub_id, enrich=True)
+                ),
+            )
+            try:
+                hub_data, rooms_data, devices_data = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather leaves the other requests running when one fails
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            # Nothing changed since the last poll, keep the parsed data
+            if (
+                self.data is not None
+                and hub_data == self._last_hub_data
+                and rooms_data == self._last_rooms_data
+                and devices_data == self._last_devices_data
+            ):
+                self._update_scan_interval(self.data.hub)
+                return self.data
+
+            rooms_changed = rooms_data != self._last_rooms_data
             self._last_hub_data = hub_data
+            self._last_rooms_data = rooms_data
+            self._last_devices_data = devices_data
             hub = self._parse_hub(hub_data)
+            self._update_scan_interval(hub)
 
-            # Get rooms
-            rooms_data = await self.api.get_hub_rooms(self.hub_id)
-            rooms = {}
-            room_names = {}  # id -> name mapping for device parsing
+            # Parse rooms
+            rooms = {room.id: room for room in map(self._parse_room, rooms_data)}
+            # id -> name mapping for device parsing
+            room_names = {room_id: room.name for room_id, room in rooms.items()}
 
-            for room_data in rooms_data:
-                room = self._parse_room(room_data)
-                rooms[room.id] = room
-                room_names[room.id] = room.name
-
-            # Get devices
-            devices_data = await self.api.get_hub_devices(self.hub_id, enrich=True)
+            # Parse devices, reusing records whose payload did not change
             devices = {}
+            parsed_devices = {}
 
             for device_data in devices_data:
-                device = self._parse_device(device_data, room_names)
+                cached = self._parsed_devices.get(_device_id(device_data))
+                if cached and not rooms_changed and cached[0] == device_data:
+                    device = cached[1]
+                else:
+                    device = self._parse_device(device_data, room_names)
                 devices[device.id] = device
+                parsed_devices[device.id] = (device_data, device)
+
+            self._parsed_devices = parsed_devices
 
             # Parse groups if enabled
-            groups = {}
-            if hub.groups_enabled:
-                for group_data in hub_data.get("groups", []):
-                    group = self._parse_group(group_data)
-                    groups[group.id] = group
+            groups = (
+                {
+                    group.id: group
+                    for group in map(self._parse_group, hub_data.get("groups", ()))
+                }
+                if hub.groups_enabled
+                else {}
+            )
 
             return AjaxData(
                 hub=hub,
@@ -221,39 +407,69 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
             )
 
         except AjaxAuthError as err:
-            _LOGGER.error("Authentication error: %s", err)
+            self._log_update_error("Authentication error: %s", err)
             raise UpdateFailed(f"Authentication error: {err}") from err
         except AjaxApiError as err:
-            _LOGGER.error("API error: %s", err)
+            self._log_update_error("API error: %s", err)
             raise UpdateFailed(f"Error fetching data: {err}") from err
-        except Exception as err:
-            _LOGGER.exception("Unexpected error: %s", err)
-            raise UpdateFailed(f"Unexpected error: {err}") from err
+
+    def _log_update_error(self, msg: str, err: Exception) -> None:
+        """Log an update error, demoting repeats within the throttle window."""
+        now = time.monotonic()
+        if now - self._last_error_log >= ERROR_LOG_INTERVAL:
+            self._last_error_log = now
+            _LOGGER.error(msg, err)
+        else:
+            _LOGGER.debug(msg, err)
+
+    def _update_scan_interval(self, hub: AjaxHub) -> None:
+        """Adjust the polling interval to the hub arm state and SQS status."""
+        if hub.armed or hub.night_mode:
+            interval = self._scan_interval
+        else:
+            interval = self._disarmed_scan_interval
+
+        # SQS pushes events, polling is only a resync: shorter while events are
+        # arriving, low-frequency on a quiet hub. Until the listener is started
+        # it counts as active; once stopped, regular polling resumes.
+        if self._sqs_listener and (
+            self._sqs_listener.is_running or not self._sqs_started
+        ):
+            if self._sqs_recently_active:
+                resync = SQS_ACTIVE_SCAN_INTERVAL
+            else:
+                resync = SQS_FALLBACK_SCAN_INTERVAL
+            interval = max(interval, timedelta(seconds=resync))
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Polling interval set to %s", interval)
+            self.update_interval = interval
+
+    @property
+    def _sqs_recently_active(self) -> bool:
+        """Return True if an SQS event arrived within the activity window."""
+        return time.monotonic() - self._last_sqs_event < SQS_ACTIVITY_WINDOW
 
     def _parse_hub(self, data: dict[str, Any]) -> AjaxHub:
         """Parse hub data into AjaxHub object."""
-        state = data.get("state", data.get("armState", "DISARMED"))
-        armed = "ARMED" in state.upper() and "DISARMED" not in state.upper()
-        night_mode = "NIGHT_MODE" in state.upper() and "OFF" not in state.upper()
+        state = _get_fallback(data, "state", data, "armState", "DISARMED")
+        armed, night_mode = _parse_arm_state(state)
 
-        battery = data.get("battery", {})
+        battery = data.get("battery") or _EMPTY
         battery_level = battery.get("chargeLevelPercentage")
         battery_state = battery.get("state")
 
-        firmware = data.get("firmware", {})
+        firmware = data.get("firmware") or _EMPTY
         firmware_version = firmware.get("version")
 
         # Parse GSM and WiFi signal levels
-        gsm = data.get("gsm", {})
-        gsm_signal = gsm.get("signalLevel") if gsm else None
-
-        wifi = data.get("wifi", {})
-        wifi_signal = wifi.get("signalLevel") if wifi else None
+        gsm_signal = (data.get("gsm") or _EMPTY).get("signalLevel")
+        wifi_signal = (data.get("wifi") or _EMPTY).get("signalLevel")
 
         return AjaxHub(
             id=data.get("id", ""),
             name=data.get("name", "Ajax Hub"),
-            model=data.get("hubSubtype", data.get("type", "Hub")),
+            model=_get_fallback(data, "hubSubtype", data, "type", "Hub"),
             online=data.get("online", True),
             armed=armed,
             night_mode=night_mode,
@@ -263,44 +479,55 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
             gsm_signal=gsm_signal,
             wifi_signal=wifi_signal,
             groups_enabled=data.get("groupsEnabled", False),
-            raw_data=data,
         )
 
     def _parse_room(self, data: dict[str, Any]) -> AjaxRoom:
         """Parse room data into AjaxRoom object."""
+        room_id = data.get("id", "")
+        name = data.get("roomName", _MISSING)
+        if name is _MISSING:
+            name = f"Room {room_id}"
+
         return AjaxRoom(
-            id=data.get("id", ""),
-            name=data.get("roomName", f"Room {data.get('id', '')}"),
-            raw_data=data,
+            id=room_id,
+            name=name,
         )
 
     def _parse_device(self, data: dict[str, Any], room_names: dict[str, str] | None = None) -> AjaxDevice:
         """Parse device data into AjaxDevice object."""
-        model = data.get("model", {})
+        model = data.get("model") or _EMPTY
 
-        device_type = data.get("deviceType", model.get("deviceType", ""))
-        device_name = data.get("deviceName", model.get("deviceName", data.get("name", "Device")))
+        device_type = _get_fallback(data, "deviceType", model, "deviceType", "")
+        device_name = _get_fallback(data, "deviceName", model, "deviceName", _MISSING)
+        if device_name is _MISSING:
+            device_name = data.get("name", "Device")
 
         battery_level = model.get("batteryChargeLevelPercentage")
-        signal_str = model.get("signalLevel", "")
-        signal_strength = SIGNAL_LEVEL_MAP.get(signal_str) if signal_str else None
+        signal_strength = SIGNAL_LEVEL_MAP.get(model.get("signalLevel") or "")
         temperature = model.get("temperature")
 
-        triggered = self._determine_triggered_state(device_type, model)
+        category = classify_device_type(device_type)
+        triggered = self._determine_triggered_state(category, model)
         bypass_state = model.get("bypassState", [])
         bypassed = bool(bypass_state)
 
-        room_id = data.get("roomId", model.get("roomId"))
+        room_id = _get_fallback(data, "roomId", model, "roomId")
         room_name = room_names.get(room_id) if room_names and room_id else None
 
+        switch_state = None
+        if category is DeviceCategory.SWITCH:
+            switch_state = _parse_switch_state(
+                _get_fallback(data, "switchState", data, "state")
+            )
+
         return AjaxDevice(
-            id=data.get("id", model.get("id", "")),
+            id=_device_id(data),
             name=device_name,
             device_type=device_type,
             room_id=room_id,
             room_name=room_name,
-            group_id=data.get("groupId", model.get("groupId")),
-            online=model.get("online", data.get("online", False)),
+            group_id=_get_fallback(data, "groupId", model, "groupId"),
+            online=_get_fallback(model, "online", data, "online", False),
             battery_level=battery_level,
             signal_strength=signal_strength,
             temperature=temperature,
@@ -308,40 +535,32 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
             triggered=triggered,
             bypassed=bypassed,
             firmware_version=model.get("firmwareVersion"),
-            raw_data=data,
+            switch_state=switch_state,
         )
 
-    def _determine_triggered_state(self, device_type: str, model: dict[str, Any]) -> bool:
-        """Determine triggered state based on device type."""
-        if any(t in device_type for t in DOOR_SENSORS):
-            reed_closed = model.get("reedClosed", True)
-            return not reed_closed
-        elif any(t in device_type for t in MOTION_SENSORS):
-            state = model.get("state", "")
-            return state.upper() in ("ACTIVE", "ALARM", "TRIGGERED")
-        elif any(t in device_type for t in SMOKE_SENSORS):
-            state = model.get("state", "")
-            return state.upper() in ("ALARM", "TRIGGERED", "SMOKE")
-        elif any(t in device_type for t in WATER_SENSORS):
-            state = model.get("state", "")
-            return state.upper() in ("ALARM", "TRIGGERED", "LEAK")
-        elif any(t in device_type for t in GLASS_BREAK_SENSORS):
-            state = model.get("state", "")
-            return state.upper() in ("ALARM", "TRIGGERED")
-        return False
+    def _determine_triggered_state(
+        self, category: DeviceCategory | None, model: dict[str, Any]
+    ) -> bool:
+        """Determine triggered state based on device category."""
+        handler = _TRIGGER_HANDLERS.get(category)
+        return handler(model) if handler else False
 
     def _parse_group(self, data: dict[str, Any]) -> AjaxGroup:
         """Parse group data into AjaxGroup object."""
-        state = data.get("armState", data.get("state", "DISARMED"))
-        armed = "ARMED" in state.upper() and "DISARMED" not in state.upper()
+        state = _get_fallback(data, "armState", data, "state", "DISARMED")
+        armed, _ = _parse_arm_state(state)
         night_mode = data.get("nightMode", False)
 
+        group_id = data.get("id", "")
+        name = data.get("name", _MISSING)
+        if name is _MISSING:
+            name = f"Group {group_id}"
+
         return AjaxGroup(
-            id=data.get("id", ""),
-            name=data.get("name", f"Group {data.get('id', '')}"),
+            id=group_id,
+            name=name,
             armed=armed,
             night_mode=night_mode,
-            raw_data=data,
         )
 
     # Arming methods
@@ -391,8 +610,13 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
         state: bool,
     ) -> None:
         """Turn a switch device on or off."""
-        device = self.data.devices.get(device_id)
-        if device:
+        # Serialize commands per device so rapid toggles reach the hub in order.
+        # Always send: switch_state can be stale (SQS events don't carry it).
+        lock = self._switch_locks.setdefault(device_id, asyncio.Lock())
+        async with lock:
+            device = self.data.devices.get(device_id)
+            if not device:
+                return
             await self.api.switch_device(
                 self.hub_id,
                 device_id,
@@ -414,8 +638,6 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
     def _init_sqs_listener(self, entry: ConfigEntry) -> None:
         """Initialize the SQS listener."""
         try:
-            from .sqs_listener import AjaxSqsListener
-
             # SQS config is stored in options
             queue_url = entry.options.get(CONF_SQS_QUEUE_URL)
             aws_access_key = entry.options.get(CONF_AWS_ACCESS_KEY)
@@ -437,8 +659,6 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
             self._sqs_listener.register_callback(self._handle_sqs_event)
             _LOGGER.info("SQS listener initialized for hub %s", self.hub_id)
 
-        except ImportError as err:
-            _LOGGER.warning("Could not import SQS listener: %s", err)
         except Exception as err:
             _LOGGER.error("Error initializing SQS listener: %s", err)
 
@@ -446,59 +666,86 @@ class AjaxDataUpdateCoordinator(DataUpdateCoordinator[AjaxData]):
         """Start the SQS listener."""
         if self._sqs_listener:
             await self._sqs_listener.start()
+            self._sqs_started = True
 
     async def async_stop_sqs_listener(self) -> None:
         """Stop the SQS listener."""
         if self._sqs_listener:
+            self._sqs_started = False
             await self._sqs_listener.stop()
+        self._sqs_debouncer.async_cancel()
 
     @callback
     def _handle_sqs_event(self, event: AjaxSqsEvent) -> None:
         """Handle an event from SQS."""
-        from .sqs_listener import (
-            EVENT_TYPE_ARM,
-            EVENT_TYPE_DEVICE_STATE,
-            EVENT_TYPE_DEVICE_TRIGGERED,
-            EVENT_TYPE_DISARM,
-            EVENT_TYPE_NIGHT_MODE,
-        )
-
         _LOGGER.debug(
             "Processing SQS event: type=%s, device=%s",
             event.event_type,
             event.device_id,
         )
 
+        was_active = self._sqs_recently_active
+        self._last_sqs_event = time.monotonic()
+
         # Update local state based on event type
-        if event.event_type in (EVENT_TYPE_ARM, EVENT_TYPE_DISARM, EVENT_TYPE_NIGHT_MODE):
-            # Hub arming state changed - trigger a refresh
+        handler = self._sqs_handlers.get(event.event_type)
+        updated = handler(event) if handler else False
+
+        # First event on a quiet hub: switch to the active resync interval,
+        # using any arm state applied above. A pushed update or a requested
+        # refresh reschedules polling with it; otherwise request a refresh.
+        if not was_active and self.data and self.data.hub:
+            self._update_scan_interval(self.data.hub)
+            if not updated:
+                self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_notify_sqs_update(self) -> None:
+        """Push locally updated data to listeners."""
+        if self.data is not None:
+            self.async_set_updated_data(self.data)
+
+    @callback
+    def _handle_sqs_arm_event(self, event: AjaxSqsEvent) -> bool:
+        """Handle a hub arm, disarm or night mode event from SQS.
+
+        Return True if listeners were notified or a refresh was requested.
+        """
+        hub = self.data.hub if self.data else None
+        if hub is None or event.group_id or not event.armed_state:
+            # Arm state not carried by the event - trigger a refresh
             self.hass.async_create_task(self.async_request_refresh())
+            return True
+
+        # Hub arming state changed - apply it without polling
+        armed, night_mode = _parse_arm_state(event.armed_state)
+        if (armed, night_mode) != (hub.armed, hub.night_mode):
+            self.data.hub = replace(hub, armed=armed, night_mode=night_mode)
+            # Local state now differs from the polled payload
+            self._last_hub_data = {}
+            self._sqs_debouncer.async_schedule_call()
+            return True
+        return False
 
-        elif event.event_type in (EVENT_TYPE_DEVICE_STATE, EVENT_TYPE_DEVICE_TRIGGERED):
-            # Device state changed - update local data and notify listeners
-            if event.device_id and self.data and event.device_id in self.data.devices:
-                device = self.data.devices[event.device_id]
-                if event.triggered is not None:
-                    # Create updated device with new triggered state
-                    self.data.devices[event.device_id] = AjaxDevice(
-                        id=device.id,
-                        name=device.name,
-                        device_type=device.device_type,
-                        room_id=device.room_id,
-                        room_name=device.room_name,
-                        group_id=device.group_id,
-                        online=device.online,
-                        battery_level=device.battery_level,
-                        signal_strength=device.signal_strength,
-                        temperature=device.temperature,
-                        tampered=device.tampered,
-                        triggered=event.triggered,
-                        bypassed=device.bypassed,
-                        firmware_version=device.firmware_version,
-                        raw_data=device.raw_data,
-                    )
-                    # Notify listeners
-                    self.async_set_updated_data(self.data)
+    @callback
+    def _handle_sqs_device_event(self, event: AjaxSqsEvent) -> bool:
+        """Handle a device state or triggered event from SQS.
+
+        Return True if listeners were notified.
+        """
+        # Device state changed - update local data and notify listeners
+        if event.device_id and self.data and event.device_id in self.data.devices:
+            device = self.data.devices[event.device_id]
+            if event.triggered is not None and event.triggered != device.triggered:
+                self.data.devices[event.device_id] = replace(
+                    device, triggered=event.triggered
+                )
+                # Local state now differs from the polled payload
+                self._last_devices_data = None
+                # Notify listeners, coalescing bursts of events
+                self._sqs_debouncer.async_schedule_call()
+                return True
+        return False
 
     @property
     def sqs_enabled(self) -> bool:
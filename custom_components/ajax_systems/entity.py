@@ -0,0 +1,70 @@
+"""Shared entity helpers for Ajax Systems."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import AjaxDataUpdateCoordinator, AjaxDevice
+
+
+@lru_cache(maxsize=None)
+def build_device_info(
+    device_id: str,
+    name: str,
+    device_type: str,
+    hub_id: str,
+) -> DeviceInfo:
+    """Return the DeviceInfo for an Ajax device, shared by all its entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_id)},
+        name=name,
+        manufacturer="Ajax Systems",
+        model=device_type,
+        via_device=(DOMAIN, hub_id),
+    )
+
+
+class AjaxDeviceEntity(CoordinatorEntity[AjaxDataUpdateCoordinator]):
+    """Base class for entities bound to a single Ajax device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: AjaxDataUpdateCoordinator,
+        device: AjaxDevice,
+        key: str,
+    ) -> None:
+        """Initialize the device entity."""
+        super().__init__(coordinator)
+        self._device_id = device.id
+        self._device: AjaxDevice | None = device
+
+        self._attr_unique_id = f"{DOMAIN}_{device.id}_{key}"
+
+        self._attr_device_info = build_device_info(
+            device.id,
+            device.display_name,
+            device.device_type,
+            coordinator.hub_id,
+        )
+
+    def _get_device(self) -> AjaxDevice | None:
+        """Get device data cached at the last coordinator update."""
+        return self._device
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the device record, then write the new state."""
+        self._device = self.coordinator.data.devices.get(self._device_id)
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        device = self._device
+        return device is not None and device.online
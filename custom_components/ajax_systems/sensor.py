@@ -13,16 +13,19 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SIGNAL_LEVEL_MAP
 from .coordinator import AjaxDataUpdateCoordinator, AjaxDevice
+from .entity import AjaxDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,31 +35,41 @@ async def async_setup_entry(
     """Set up Ajax Systems sensors."""
     coordinator: AjaxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-
-    # Hub sensors
-    if coordinator.data.hub:
-        hub = coordinator.data.hub
-        if hub.battery_level is not None:
-            entities.append(AjaxHubBatterySensor(coordinator))
-        if hub.gsm_signal is not None:
-            entities.append(AjaxHubGsmSignalSensor(coordinator))
-        if hub.wifi_signal is not None:
-            entities.append(AjaxHubWifiSignalSensor(coordinator))
-
-    # Device sensors
-    for device_id, device in coordinator.data.devices.items():
-        # Battery sensor
-        if device.battery_level is not None:
-            entities.append(AjaxDeviceBatterySensor(coordinator, device))
-
-        # Signal strength sensor
-        if device.signal_strength is not None:
-            entities.append(AjaxDeviceSignalSensor(coordinator, device))
-
-        # Temperature sensor
-        if device.temperature is not None:
-            entities.append(AjaxDeviceTemperatureSensor(coordinator, device))
+    hub = coordinator.data.hub
+    devices = coordinator.data.devices.values()
+
+    entities: list[SensorEntity] = [
+        # Hub sensors
+        *(
+            [
+                sensor(coordinator)
+                for sensor, value in (
+                    (AjaxHubBatterySensor, hub.battery_level),
+                    (AjaxHubGsmSignalSensor, hub.gsm_signal),
+                    (AjaxHubWifiSignalSensor, hub.wifi_signal),
+                )
+                if value is not None
+            ]
+            if hub
+            else ()
+        ),
+        # Device sensors
+        *(
+            AjaxDeviceBatterySensor(coordinator, device)
+            for device in devices
+            if device.battery_level is not None
+        ),
+        *(
+            AjaxDeviceSignalSensor(coordinator, device)
+            for device in devices
+            if device.signal_strength is not None
+        ),
+        *(
+            AjaxDeviceTemperatureSensor(coordinator, device)
+            for device in devices
+            if device.temperature is not None
+        ),
+    ]
 
     async_add_entities(entities)
 
@@ -92,11 +105,6 @@ class AjaxHubBatterySensor(
         hub = self.coordinator.data.hub
         return hub.battery_level if hub else None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
 class AjaxHubGsmSignalSensor(
     CoordinatorEntity[AjaxDataUpdateCoordinator], SensorEntity
@@ -108,6 +116,7 @@ class AjaxHubGsmSignalSensor(
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:signal-cellular-3"
+    _signal_map = SIGNAL_LEVEL_MAP
 
     def __init__(self, coordinator: AjaxDataUpdateCoordinator) -> None:
         """Initialize the hub GSM signal sensor."""
@@ -128,14 +137,9 @@ class AjaxHubGsmSignalSensor(
         """Return the GSM signal level."""
         hub = self.coordinator.data.hub
         if hub and hub.gsm_signal is not None:
-            return SIGNAL_LEVEL_MAP.get(hub.gsm_signal, hub.gsm_signal)
+            return self._signal_map.get(hub.gsm_signal, hub.gsm_signal)
         return None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
 class AjaxHubWifiSignalSensor(
     CoordinatorEntity[AjaxDataUpdateCoordinator], SensorEntity
@@ -147,6 +151,7 @@ class AjaxHubWifiSignalSensor(
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:wifi"
+    _signal_map = SIGNAL_LEVEL_MAP
 
     def __init__(self, coordinator: AjaxDataUpdateCoordinator) -> None:
         """Initialize the hub WiFi signal sensor."""
@@ -167,21 +172,13 @@ class AjaxHubWifiSignalSensor(
         """Return the WiFi signal level."""
         hub = self.coordinator.data.hub
         if hub and hub.wifi_signal is not None:
-            return SIGNAL_LEVEL_MAP.get(hub.wifi_signal, hub.wifi_signal)
+            return self._signal_map.get(hub.wifi_signal, hub.wifi_signal)
         return None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class AjaxDeviceBatterySensor(
-    CoordinatorEntity[AjaxDataUpdateCoordinator], SensorEntity
-):
+class AjaxDeviceBatterySensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax device battery sensor."""
 
-    _attr_has_entity_name = True
     _attr_name = "Battery"
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -193,22 +190,7 @@ class AjaxDeviceBatterySensor(
         device: AjaxDevice,
     ) -> None:
         """Initialize the device battery sensor."""
-        super().__init__(coordinator)
-        self._device_id = device.id
-
-        self._attr_unique_id = f"{DOMAIN}_{device.id}_battery"
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.id)},
-            name=device.display_name,
-            manufacturer="Ajax Systems",
-            model=device.device_type,
-            via_device=(DOMAIN, coordinator.hub_id),
-        )
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get device data from coordinator."""
-        return self.coordinator.data.devices.get(self._device_id)
+        super().__init__(coordinator, device, "battery")
 
     @property
     def native_value(self) -> int | None:
@@ -216,24 +198,10 @@ class AjaxDeviceBatterySensor(
         device = self._get_device()
         return device.battery_level if device else None
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        device = self._get_device()
-        return device is not None and device.online
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class AjaxDeviceSignalSensor(
-    CoordinatorEntity[AjaxDataUpdateCoordinator], SensorEntity
-):
+class AjaxDeviceSignalSensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax device signal strength sensor."""
 
-    _attr_has_entity_name = True
     _attr_name = "Signal Strength"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -246,22 +214,7 @@ class AjaxDeviceSignalSensor(
         device: AjaxDevice,
     ) -> None:
         """Initialize the device signal sensor."""
-        super().__init__(coordinator)
-        self._device_id = device.id
-
-        self._attr_unique_id = f"{DOMAIN}_{device.id}_signal"
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.id)},
-            name=device.display_name,
-            manufacturer="Ajax Systems",
-            model=device.device_type,
-            via_device=(DOMAIN, coordinator.hub_id),
-        )
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get device data from coordinator."""
-        return self.coordinator.data.devices.get(self._device_id)
+        super().__init__(coordinator, device, "signal")
 
     @property
     def native_value(self) -> int | None:
@@ -270,24 +223,10 @@ class AjaxDeviceSignalSensor(
         # signal_strength is already converted to percentage in coordinator
         return device.signal_strength if device else None
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        device = self._get_device()
-        return device is not None and device.online
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
 
-
-class AjaxDeviceTemperatureSensor(
-    CoordinatorEntity[AjaxDataUpdateCoordinator], SensorEntity
-):
+class AjaxDeviceTemperatureSensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax device temperature sensor."""
 
-    _attr_has_entity_name = True
     _attr_name = "Temperature"
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -299,36 +238,10 @@ class AjaxDeviceTemperatureSensor(
         device: AjaxDevice,
     ) -> None:
         """Initialize the device temperature sensor."""
-        super().__init__(coordinator)
-        self._device_id = device.id
-
-        self._attr_unique_id = f"{DOMAIN}_{device.id}_temperature"
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device.id)},
-            name=device.display_name,
-            manufacturer="Ajax Systems",
-            model=device.device_type,
-            via_device=(DOMAIN, coordinator.hub_id),
-        )
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get device data from coordinator."""
-        return self.coordinator.data.devices.get(self._device_id)
+        super().__init__(coordinator, device, "temperature")
 
     @property
     def native_value(self) -> float | None:
         """Return the temperature."""
         device = self._get_device()
         return device.temperature if device else None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        device = self._get_device()
-        return device is not None and device.online
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from dataclasses import dataclass
+import random
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable
+from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,53 +29,92 @@ EVENT_TYPE_BATTERY_LOW = "BATTERY_LOW"
 EVENT_TYPE_CONNECTION_LOST = "CONNECTION_LOST"
 EVENT_TYPE_CONNECTION_RESTORED = "CONNECTION_RESTORED"
 
+_HUB_ID_KEYS = ("hubId", "objectId")
+
+# Event attribute -> candidate message keys (first present wins), default
+_EVENT_FIELDS: tuple[tuple[str, tuple[str, ...], Any], ...] = (
+    ("event_id", ("eventId", "id"), ""),
+    ("event_type", ("eventType", "type"), "UNKNOWN"),
+    ("hub_id", _HUB_ID_KEYS, ""),
+    ("device_id", ("deviceId", "sourceObjectId"), None),
+    ("device_type", ("deviceType", "sourceObjectType"), None),
+    ("room_name", ("roomName", "room"), None),
+    ("group_id", ("groupId",), None),
+    ("armed_state", ("armState", "state"), None),
+    ("triggered", ("triggered", "alarm"), None),
+)
+
+_MISSING: Any = object()
+
+
+def _first_present(body: dict[str, Any], keys: tuple[str, ...], default: Any) -> Any:
+    """Return the value of the first key present in body, else default."""
+    for key in keys:
+        value = body.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def _message_body(message: dict[str, Any]) -> dict[str, Any]:
+    """Return the decoded JSON body of an SQS message."""
+    # aiobotocore returns the payload under "Body"
+    body = message.get("Body")
+    if body is None:
+        body = message.get("body", message)
+    if isinstance(body, (str, bytes)):
+        body = json_loads(body)
+    return body
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AjaxSqsEvent:
     """Representation of an Ajax SQS event."""
 
     event_id: str
     event_type: str
     hub_id: str
-    timestamp: datetime
+    # Event time as ns since the epoch; see the timestamp property
+    timestamp_ns: int
     device_id: str | None = None
     device_type: str | None = None
     room_name: str | None = None
     group_id: str | None = None
     armed_state: str | None = None
     triggered: bool | None = None
-    raw_data: dict[str, Any] | None = None
+    # Only kept while debug logging is enabled
+    raw_data: dict[str, Any] | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_sqs_message(cls, message: dict[str, Any]) -> AjaxSqsEvent:
         """Create an AjaxSqsEvent from an SQS message body."""
-        body = message.get("body", message)
-        if isinstance(body, str):
-            body = json.loads(body)
+        return cls.from_body(_message_body(message))
 
-        # Parse timestamp
+    @classmethod
+    def from_body(cls, body: dict[str, Any]) -> AjaxSqsEvent:
+        """Create an AjaxSqsEvent from an already decoded message body."""
+        # Parse timestamp (ciso8601-backed, handles the trailing "Z")
         timestamp_str = body.get("timestamp", body.get("eventTime"))
-        if timestamp_str:
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            except ValueError:
-                timestamp = datetime.now()
+        if timestamp_str and (parsed := dt_util.parse_datetime(timestamp_str)):
+            timestamp_ns = round(dt_util.as_timestamp(parsed) * 1_000_000) * 1000
         else:
-            timestamp = datetime.now()
-
-        return cls(
-            event_id=body.get("eventId", body.get("id", "")),
-            event_type=body.get("eventType", body.get("type", "UNKNOWN")),
-            hub_id=body.get("hubId", body.get("objectId", "")),
-            timestamp=timestamp,
-            device_id=body.get("deviceId", body.get("sourceObjectId")),
-            device_type=body.get("deviceType", body.get("sourceObjectType")),
-            room_name=body.get("roomName", body.get("room")),
-            group_id=body.get("groupId"),
-            armed_state=body.get("armState", body.get("state")),
-            triggered=body.get("triggered", body.get("alarm")),
-            raw_data=body,
-        )
+            timestamp_ns = time.time_ns()
+
+        fields = {
+            name: _first_present(body, keys, default)
+            for name, keys, default in _EVENT_FIELDS
+        }
+        raw_data = body if _LOGGER.isEnabledFor(logging.DEBUG) else None
+        return cls(timestamp_ns=timestamp_ns, raw_data=raw_data, **fields)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the event time as an aware UTC datetime."""
+        return dt_util.utc_from_timestamp(self.timestamp_ns / 1_000_000_000)
+
+
+# Callbacks may be plain functions or coroutine functions
+EventCallback = Callable[[AjaxSqsEvent], Coroutine[Any, Any, None] | None]
 
 
 class AjaxSqsListener:
@@ -99,17 +142,17 @@ class AjaxSqsListener:
 
         self._running = False
         self._task: asyncio.Task | None = None
-        self._callbacks: list[Callable[[AjaxSqsEvent], None]] = []
+        # Immutable snapshot, rebuilt on (rare) register/unregister
+        self._callbacks: tuple[EventCallback, ...] = ()
         self._sqs_client = None
 
-    def register_callback(self, callback: Callable[[AjaxSqsEvent], None]) -> None:
+    def register_callback(self, callback: EventCallback) -> None:
         """Register a callback for received events."""
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
 
-    def unregister_callback(self, callback: Callable[[AjaxSqsEvent], None]) -> None:
+    def unregister_callback(self, callback: EventCallback) -> None:
         """Unregister a callback."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks = tuple(cb for cb in self._callbacks if cb != callback)
 
     async def _get_sqs_client(self):
         """Get or create the SQS client."""
@@ -160,60 +203,106 @@ class AjaxSqsListener:
 
         _LOGGER.info("SQS listener stopped")
 
+    async def _receive_messages(self, client) -> dict[str, Any]:
+        """Long poll the queue for up to 10 messages."""
+        return await client.receive_message(
+            QueueUrl=self._queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=20,  # Long polling (AWS maximum)
+            AttributeNames=["All"],
+            MessageAttributeNames=["All"],
+        )
+
     async def _poll_loop(self) -> None:
         """Main polling loop using long polling."""
         consecutive_errors = 0
         max_consecutive_errors = 5
+        # Next receive, started while the previous batch was being deleted
+        prefetch: asyncio.Task | None = None
 
-        while self._running:
-            try:
-                client = await self._get_sqs_client()
-
-                # Long polling with 20 second wait (AWS maximum)
-                response = await client.receive_message(
-                    QueueUrl=self._queue_url,
-                    MaxNumberOfMessages=10,
-                    WaitTimeSeconds=20,  # Long polling
-                    AttributeNames=["All"],
-                    MessageAttributeNames=["All"],
-                )
-
-                messages = response.get("Messages", [])
-
-                for message in messages:
-                    await self._process_message(client, message)
-
-                consecutive_errors = 0
-
-            except asyncio.CancelledError:
-                raise
-            except Exception as err:
-                consecutive_errors += 1
-                _LOGGER.error("Error polling SQS: %s", err)
-
-                if consecutive_errors >= max_consecutive_errors:
-                    _LOGGER.error(
-                        "Too many consecutive errors, stopping SQS listener"
+        try:
+            while self._running:
+                try:
+                    client = await self._get_sqs_client()
+
+                    if prefetch is not None:
+                        task, prefetch = prefetch, None
+                        response = await task
+                    else:
+                        response = await self._receive_messages(client)
+
+                    messages = response.get("Messages", [])
+
+                    entries = []
+                    for message in messages:
+                        receipt_handle = self._process_message(message)
+                        if receipt_handle:
+                            entries.append(
+                                {
+                                    "Id": str(len(entries)),
+                                    "ReceiptHandle": receipt_handle,
+                                }
+                            )
+
+                    # Delete processed messages in one round-trip (max 10 per
+                    # batch), overlapping it with the next long poll
+                    if entries:
+                        prefetch = asyncio.create_task(self._receive_messages(client))
+                        result = await client.delete_message_batch(
+                            QueueUrl=self._queue_url,
+                            Entries=entries,
+                        )
+                        # Per-entry failures are reported in the response, not raised
+                        for failed in result.get("Failed", ()):
+                            _LOGGER.error(
+                                "Failed to delete SQS message %s: %s - %s",
+                                failed.get("Id"),
+                                failed.get("Code"),
+                                failed.get("Message"),
+                            )
+
+                    consecutive_errors = 0
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as err:
+                    consecutive_errors += 1
+                    _LOGGER.error("Error polling SQS: %s", err)
+
+                    if consecutive_errors >= max_consecutive_errors:
+                        _LOGGER.error(
+                            "Too many consecutive errors, stopping SQS listener"
+                        )
+                        self._running = False
+                        break
+
+                    # Exponential backoff, jittered so listeners sharing
+                    # credentials don't retry in lockstep
+                    await asyncio.sleep(
+                        min(2 ** consecutive_errors, 60) * random.uniform(0.5, 1.5)
                     )
-                    self._running = False
-                    break
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
 
-                # Exponential backoff
-                await asyncio.sleep(min(2 ** consecutive_errors, 60))
+    def _process_message(self, message: dict[str, Any]) -> str | None:
+        """Process a single SQS message.
 
-    async def _process_message(self, client, message: dict[str, Any]) -> None:
-        """Process a single SQS message."""
+        Returns the receipt handle to delete, or None if processing failed.
+        """
         try:
-            event = AjaxSqsEvent.from_sqs_message(message)
+            body = _message_body(message)
 
-            # Filter by hub_id if specified
-            if self._hub_id and event.hub_id != self._hub_id:
+            # Filter by hub_id if specified, before building the event
+            hub_id = _first_present(body, _HUB_ID_KEYS, "")
+            if self._hub_id and hub_id != self._hub_id:
                 _LOGGER.debug(
                     "Ignoring event for hub %s (listening for %s)",
-                    event.hub_id,
+                    hub_id,
                     self._hub_id,
                 )
             else:
+                event = AjaxSqsEvent.from_body(body)
                 _LOGGER.debug(
                     "Received event: type=%s, hub=%s, device=%s",
                     event.event_type,
@@ -221,23 +310,22 @@ class AjaxSqsListener:
                     event.device_id,
                 )
 
-                # Notify callbacks
+                # Notify callbacks; coroutine callbacks run as tasks so the
+                # poller can move on to the next message straight away
                 for callback in self._callbacks:
                     try:
-                        callback(event)
+                        result = callback(event)
                     except Exception as err:
                         _LOGGER.error("Error in event callback: %s", err)
+                    else:
+                        if asyncio.iscoroutine(result):
+                            self._hass.async_create_task(result)
 
-            # Delete message from queue after processing
-            receipt_handle = message.get("ReceiptHandle")
-            if receipt_handle:
-                await client.delete_message(
-                    QueueUrl=self._queue_url,
-                    ReceiptHandle=receipt_handle,
-                )
+            return message.get("ReceiptHandle")
 
         except Exception as err:
             _LOGGER.error("Error processing SQS message: %s", err)
+            return None
 
     @property
     def is_running(self) -> bool: